@@ -0,0 +1,2 @@
+# bench/ — offline benchmark and load-test suite
+# Run from the repo root:  python -m bench.run_bench --help
@@ -0,0 +1,150 @@
+# bench/fixtures.py — synthetic report fixtures (fpdf2 for PDFs, PyMuPDF to rasterise images)
+
+from pathlib import Path
+from typing import List, Union
+import io
+import random
+import wave
+
+
+# (analyte, unit, low, high) — realistic blood test / tumor-marker rows
+LAB_ROWS = [
+    ("Haemoglobin", "g/dL", 13.0, 17.0),
+    ("WBC Count", "x10^3/uL", 4.0, 11.0),
+    ("Platelet Count", "x10^3/uL", 150.0, 410.0),
+    ("Neutrophils", "%", 40.0, 80.0),
+    ("Creatinine", "mg/dL", 0.7, 1.3),
+    ("ALT (SGPT)", "U/L", 7.0, 56.0),
+    ("AST (SGOT)", "U/L", 10.0, 40.0),
+    ("LDH", "U/L", 140.0, 280.0),
+    ("CEA", "ng/mL", 0.0, 5.0),
+    ("CA 19-9", "U/mL", 0.0, 37.0),
+    ("CA-125", "U/mL", 0.0, 35.0),
+    ("PSA (Total)", "ng/mL", 0.0, 4.0),
+    ("AFP", "ng/mL", 0.0, 8.5),
+    ("Beta-hCG", "mIU/mL", 0.0, 5.0),
+]
+
+
+# Two-column narrative text, laid out like a histopathology report
+NARRATIVE_LEFT = [
+    "GROSS: Received left orchidectomy specimen",
+    "measuring 6 x 4 x 3 cm with attached cord.",
+    "Cut surface shows a grey-white fleshy tumour.",
+]
+NARRATIVE_RIGHT = [
+    "MICROSCOPY: Sheets of atypical lymphoid cells",
+    "with prominent nucleoli and frequent mitoses.",
+    "Spermatic cord resection margin is free.",
+]
+
+
+def _lab_row_cells(rng: random.Random, i: int) -> List[str]:
+    name, unit, low, high = LAB_ROWS[i % len(LAB_ROWS)]
+    value = round(rng.uniform(low * 0.5, high * 1.6), 1)
+    return [name, f"{value}", unit, f"{low} - {high}"]
+
+
+def make_report_pdf(path: Union[str, Path], pages: int = 2, rows_per_page: int = 14, seed: int = 0) -> Path:
+    """Write a synthetic lab report PDF with a results table on every page."""
+    from fpdf import FPDF  # fpdf2 — only the PDF/image subsystems need it
+
+    rng = random.Random(seed)
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=False)
+
+    for page in range(pages):
+        pdf.add_page()
+        pdf.set_font("Helvetica", "B", 14)
+        pdf.cell(0, 10, "City Oncology Lab - Laboratory Report", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", "", 10)
+        pdf.cell(0, 7, f"Patient: Test Patient {seed}    Page {page + 1} of {pages}", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(4)
+
+        pdf.set_font("Helvetica", "B", 11)
+        for header, width in zip(("Test", "Result", "Unit", "Reference Range"), (70, 30, 35, 45)):
+            pdf.cell(width, 8, header, border=1)
+        pdf.ln()
+
+        pdf.set_font("Helvetica", "", 11)
+        for i in range(rows_per_page):
+            for cell, width in zip(_lab_row_cells(rng, i), (70, 30, 35, 45)):
+                pdf.cell(width, 8, cell, border=1)
+            pdf.ln()
+
+    path = Path(path)
+    pdf.output(str(path))
+    return path
+
+
+def make_narrative_pdf(path: Union[str, Path], pages: int = 1) -> Path:
+    """Write a synthetic two-column narrative report (no lab table)."""
+    from fpdf import FPDF  # fpdf2 — only the PDF/image subsystems need it
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=False)
+
+    for page in range(pages):
+        pdf.add_page()
+        pdf.set_font("Helvetica", "B", 14)
+        pdf.cell(0, 10, "Histopathology Report", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", "", 10)
+        top = pdf.get_y() + 4
+        for x, lines in ((10, NARRATIVE_LEFT), (110, NARRATIVE_RIGHT)):
+            for i, line in enumerate(lines * 4):
+                pdf.set_xy(x, top + i * 7)
+                pdf.cell(95, 7, line)
+
+    path = Path(path)
+    pdf.output(str(path))
+    return path
+
+
+def make_ocr_boxes(pages: int = 2, rows_per_page: int = 14, seed: int = 0) -> List[list]:
+    """(boxes, error) pages shaped like extract_boxes_from_file's output, with a little jitter."""
+    rng = random.Random(seed)
+    columns = (20, 160, 220, 290)
+    result = []
+
+    for _ in range(pages):
+        boxes = [([[20, 20], [400, 20], [400, 44], [20, 44]], "City Oncology Lab - Laboratory Report", 0.98)]
+        for i in range(rows_per_page):
+            y = 80 + i * 32 + rng.uniform(-3, 3)
+            for x, text in zip(columns, _lab_row_cells(rng, i)):
+                width = 9 * len(text)
+                boxes.append(([[x, y], [x + width, y], [x + width, y + 22], [x, y + 22]], text, 0.9))
+        rng.shuffle(boxes)  # EasyOCR gives no reading-order guarantee
+        result.append((boxes, None))
+
+    return result
+
+
+def make_report_images(pdf_path: Union[str, Path], out_dir: Union[str, Path], zoom: float = 2.0) -> List[Path]:
+    """Rasterise each page of a fixture PDF to PNG (stand-in for a photographed report)."""
+    import fitz  # PyMuPDF — only the OCR subsystems need it
+
+    out_dir = Path(out_dir)
+    images = []
+
+    doc = fitz.open(str(pdf_path))
+    try:
+        for page_number in range(len(doc)):
+            pix = doc.load_page(page_number).get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            image_path = out_dir / f"{Path(pdf_path).stem}_page{page_number + 1}.png"
+            pix.save(str(image_path))
+            images.append(image_path)
+    finally:
+        doc.close()
+
+    return images
+
+
+def make_audio_clip(seconds: float = 2.0) -> bytes:
+    """Silent 16 kHz mono WAV — the stub server never decodes it, only the upload size matters."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00\x00" * int(16000 * seconds))
+    return buf.getvalue()
@@ -0,0 +1,51 @@
+# bench/load.py — simulated multi-session load driver for the chat loop
+# Each turn goes through core.chat.respond, the same code chatbot.ask_bot runs.
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+import random
+import time
+import uuid
+
+from context import init_conversation as PATIENT_CONTEXT_FUNC
+from core.chat import respond
+from local_db import create_session
+
+
+# Mix of ordinary questions and ones that trip the guardrails (roughly 1 in 4)
+SCRIPT = [
+    "can you tell me what this report is about",
+    "what does stage II mean for breast cancer",
+    "is it normal to feel tired after chemotherapy",
+    "can i travel to a hill station",
+    "what is the dosage of my medicine",
+    "what foods help during radiation",
+    "how do i book an appointment",
+    "what does a high CEA level mean",
+]
+
+
+def _run_session(client, turns: int, seed: int) -> List[float]:
+    rng = random.Random(seed)
+    session_id = str(uuid.uuid4())
+    create_session(session_id, "patient")
+    history = [{"role": "system", "content": PATIENT_CONTEXT_FUNC()}]
+
+    latencies = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        respond(client, session_id, history, rng.choice(SCRIPT))
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def drive_sessions(client, sessions: int, turns: int, seed: int = 0) -> Dict:
+    """Run `sessions` concurrent chat sessions of `turns` turns each.
+
+    Returns per-turn latencies (seconds) and total wall-clock time.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(_run_session, client, turns, seed + i) for i in range(sessions)]
+        latencies = [lat for f in futures for lat in f.result()]
+    return {"latencies": latencies, "wall_s": time.perf_counter() - start}
@@ -0,0 +1,322 @@
+# bench/run_bench.py — offline benchmark runner
+#
+#   python -m bench.run_bench                      # run everything, compare with bench/baselines.json
+#   python -m bench.run_bench -s chat -s guardrails
+#   python -m bench.run_bench --save-baseline      # record current numbers as the new baseline
+#
+# Baselines are machine-specific and not committed; without one for every subsystem run,
+# the runner exits 1 rather than reporting a pass.
+#
+# Each subsystem runs in its own spawned process so peak RSS is per subsystem.
+# No network is used: Groq/Whisper calls go to bench.stub_server. EasyOCR models must
+# already be in the local cache (~/.EasyOCR) for the OCR and upload subsystems.
+# upload_labs / upload_narrative time core.report.read_report, the path chatbot.py uses.
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+# metric → True if higher is better
+METRICS = {
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "throughput_ops": True,
+    "peak_rss_mb": False,
+}
+
+
+# ────────────────────────────────────────────────────────────────
+# MEASUREMENT HELPERS
+# ────────────────────────────────────────────────────────────────
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted sample list."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil without math import
+    return ordered[int(rank) - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _timed(fn: Callable[[], object], iterations: int) -> Dict:
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t0)
+    return {"latencies": latencies, "wall_s": time.perf_counter() - start}
+
+
+def summarize(raw: Dict) -> Dict:
+    latencies = raw["latencies"]
+    return {
+        "ops": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "throughput_ops": round(len(latencies) / raw["wall_s"], 3) if raw["wall_s"] else 0.0,
+        "peak_rss_mb": raw.get("peak_rss_mb"),
+    }
+
+
+# ────────────────────────────────────────────────────────────────
+# SUBSYSTEMS (run inside the child process)
+# ────────────────────────────────────────────────────────────────
+
+def _use_temp_db(workdir: Path):
+    import local_db
+
+    local_db.DB_PATH = str(workdir / "bench.db")
+    local_db.init_db()
+
+
+def bench_ocr_pdf(opts, workdir: Path) -> Dict:
+    from bench.fixtures import make_report_pdf
+    from core.ocr_engine import _get_reader, ocr_pdf_pymupdf
+
+    pdf_path = make_report_pdf(workdir / "report.pdf", pages=opts.pdf_pages)
+    _get_reader()  # model load is a one-off cost, keep it out of the timings
+    return _timed(lambda: ocr_pdf_pymupdf(pdf_path), opts.ocr_iterations)
+
+
+def bench_ocr_image(opts, workdir: Path) -> Dict:
+    from bench.fixtures import make_report_images, make_report_pdf
+    from core.ocr_engine import _get_reader, ocr_image
+
+    pdf_path = make_report_pdf(workdir / "report.pdf", pages=1)
+    image_path = make_report_images(pdf_path, workdir)[0]
+    _get_reader()
+    return _timed(lambda: ocr_image(image_path), opts.ocr_iterations)
+
+
+def bench_upload_labs(opts, workdir: Path) -> Dict:
+    from bench.fixtures import make_report_pdf
+    from core.ocr_engine import _get_reader
+    from core.report import read_report
+
+    pdf_path = make_report_pdf(workdir / "report.pdf", pages=opts.pdf_pages)
+    _get_reader()
+    return _timed(lambda: read_report(pdf_path), opts.ocr_iterations)
+
+
+def bench_upload_narrative(opts, workdir: Path) -> Dict:
+    from bench.fixtures import make_narrative_pdf
+    from core.ocr_engine import _get_reader
+    from core.report import read_report
+
+    pdf_path = make_narrative_pdf(workdir / "histopathology.pdf", pages=opts.pdf_pages)
+    _get_reader()
+    return _timed(lambda: read_report(pdf_path), opts.ocr_iterations)
+
+
+def bench_lab_extract(opts, workdir: Path) -> Dict:
+    from bench.fixtures import make_ocr_boxes
+    from core.lab_extract import extract_lab_results, lab_digest
+
+    pages = make_ocr_boxes(pages=opts.pdf_pages)
+
+    def parse_and_digest():
+        labs, other_lines = extract_lab_results(pages)
+        return lab_digest(labs, other_lines=other_lines)
+
+    return _timed(parse_and_digest, opts.iterations)
+
+
+def bench_persistence(opts, workdir: Path) -> Dict:
+    from local_db import create_session, save_message
+
+    _use_temp_db(workdir)
+    create_session("bench-session", "patient")
+    content = "x" * opts.message_chars
+    return _timed(lambda: save_message("bench-session", "user", content), opts.iterations)
+
+
+def bench_guardrails(opts, workdir: Path) -> Dict:
+    from bench.load import SCRIPT
+    from core.guardrails import guardrail_reply
+
+    messages = iter(SCRIPT * (opts.iterations // len(SCRIPT) + 1))
+    return _timed(lambda: guardrail_reply(next(messages)), opts.iterations)
+
+
+def bench_chat(opts, workdir: Path) -> Dict:
+    from groq import Groq
+
+    from bench.load import drive_sessions
+    from bench.stub_server import StubServer
+
+    _use_temp_db(workdir)
+    with StubServer(opts.stub_latency_ms) as stub:
+        client = Groq(api_key="bench", base_url=stub.url)
+        return drive_sessions(client, opts.sessions, opts.turns)
+
+
+def bench_voice(opts, workdir: Path) -> Dict:
+    import io
+
+    from openai import OpenAI
+
+    from bench.fixtures import make_audio_clip
+    from bench.stub_server import StubServer
+
+    clip = make_audio_clip()
+
+    with StubServer(opts.stub_latency_ms) as stub:
+        client = OpenAI(api_key="bench", base_url=stub.url + "/openai/v1")
+
+        def transcribe():
+            audio_file = io.BytesIO(clip)
+            audio_file.name = "voice.wav"
+            return client.audio.transcriptions.create(
+                model="whisper-large-v3",
+                file=audio_file,
+                language="en",
+                response_format="text"
+            )
+
+        return _timed(transcribe, opts.iterations // 10 or 1)
+
+
+SUBSYSTEMS = {
+    "ocr_pdf": bench_ocr_pdf,
+    "ocr_image": bench_ocr_image,
+    "upload_labs": bench_upload_labs,
+    "upload_narrative": bench_upload_narrative,
+    "lab_extract": bench_lab_extract,
+    "persistence": bench_persistence,
+    "guardrails": bench_guardrails,
+    "chat": bench_chat,
+    "voice": bench_voice,
+}
+
+
+def _run_subsystem(name: str, opts) -> Dict:
+    with tempfile.TemporaryDirectory(prefix=f"bench_{name}_") as tmp:
+        raw = SUBSYSTEMS[name](opts, Path(tmp))
+    raw["peak_rss_mb"] = peak_rss_mb()
+    return summarize(raw)
+
+
+# ────────────────────────────────────────────────────────────────
+# BASELINES
+# ────────────────────────────────────────────────────────────────
+
+def compare(results: Dict, baselines: Dict, tolerance: float, min_delta_ms: float = 0.0) -> List[str]:
+    """Return human-readable regressions beyond `tolerance` (fraction, e.g. 0.25).
+
+    Latency and throughput changes smaller than `min_delta_ms` per op are treated as noise.
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baselines.get(name)
+        if not base:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = base.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            if metric.endswith("_ms") and abs(new - old) < min_delta_ms:
+                continue
+            if metric == "throughput_ops" and new and abs(1000 / new - 1000 / old) < min_delta_ms:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(f"{name}.{metric}: {old} → {new} ({change:+.0%})")
+    return regressions
+
+
+def _print_table(results: Dict):
+    header = f"{'subsystem':<16} {'ops':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>10} {'RSS MB':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        rss = f"{r['peak_rss_mb']:.1f}" if r["peak_rss_mb"] is not None else "n/a"
+        print(f"{name:<16} {r['ops']:>6} {r['p50_ms']:>10.2f} {r['p95_ms']:>10.2f} "
+              f"{r['p99_ms']:>10.2f} {r['throughput_ops']:>10.1f} {rss:>8}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the oncology chatbot")
+    parser.add_argument("-s", "--subsystem", action="append", choices=list(SUBSYSTEMS),
+                        help="subsystem to run (repeatable, default: all)")
+    parser.add_argument("--iterations", type=int, default=500, help="ops for lab_extract/persistence/guardrails")
+    parser.add_argument("--ocr-iterations", type=int, default=3)
+    parser.add_argument("--pdf-pages", type=int, default=2)
+    parser.add_argument("--message-chars", type=int, default=800)
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent chat sessions")
+    parser.add_argument("--turns", type=int, default=10, help="turns per chat session")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression (fraction)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05,
+                        help="ignore per-op time changes smaller than this")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    opts = parser.parse_args(argv)
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for name in opts.subsystem or list(SUBSYSTEMS):
+        print(f"… {name}", file=sys.stderr)
+        with ctx.Pool(processes=1) as pool:
+            results[name] = pool.apply(_run_subsystem, (name, opts))
+
+    _print_table(results)
+
+    if opts.output:
+        opts.output.write_text(json.dumps(results, indent=2))
+
+    if opts.save_baseline:
+        baselines = json.loads(opts.baseline.read_text()) if opts.baseline.exists() else {}
+        baselines.update(results)
+        opts.baseline.write_text(json.dumps(baselines, indent=2) + "\n")
+        print(f"\nBaseline saved to {opts.baseline}")
+        return 0
+
+    # A run that compares against nothing must not pass as "no regressions"
+    if not opts.baseline.exists():
+        print(f"\nNo baseline at {opts.baseline}; run with --save-baseline to create one.")
+        return 1
+
+    baselines = json.loads(opts.baseline.read_text())
+    missing = [name for name in results if name not in baselines]
+    if missing:
+        print(f"\nNo baseline for {', '.join(missing)} in {opts.baseline}; "
+              "run with --save-baseline to add them.")
+        return 1
+
+    regressions = compare(results, baselines, opts.tolerance, opts.min_delta_ms)
+    if regressions:
+        print(f"\nRegressions beyond {opts.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    # spawned children re-import this module; make the repo root importable for them too
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.exit(main())
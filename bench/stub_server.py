@@ -0,0 +1,112 @@
+# bench/stub_server.py — local stand-in for the Groq chat + Whisper endpoints
+# Speaks just enough of the OpenAI-compatible API for groq.Groq and openai.OpenAI clients.
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+import uuid
+
+
+STUB_ANSWER = (
+    "That's a really good question. In most cases this is something your oncology team "
+    "will explain at your next visit. Final diagnosis requires confirmation from the "
+    "treating oncologist."
+)
+STUB_TRANSCRIPT = "can you tell me what this report is about"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass  # keep benchmark output clean
+
+    def _send(self, status, body: bytes, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        time.sleep(self.server.latency_s)
+
+        if self.path.endswith("/chat/completions"):
+            request = json.loads(raw or b"{}")
+            prompt_chars = sum(len(m.get("content") or "") for m in request.get("messages", []))
+            body = {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": STUB_ANSWER},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_chars // 4,
+                    "completion_tokens": len(STUB_ANSWER) // 4,
+                    "total_tokens": (prompt_chars + len(STUB_ANSWER)) // 4,
+                },
+            }
+            self._send(200, json.dumps(body).encode())
+
+        elif self.path.endswith("/audio/transcriptions"):
+            # multipart body is not parsed; chatbot.py asks for response_format="text"
+            self._send(200, STUB_TRANSCRIPT.encode(), content_type="text/plain")
+
+        else:
+            self._send(404, json.dumps({"error": {"message": f"no stub for {self.path}"}}).encode())
+
+
+class StubServer:
+    """Run the stub in a daemon thread; use as a context manager.
+
+    `url` is the base URL to give Groq(base_url=...); Whisper clients append /openai/v1.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self._httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.latency_s = latency_ms / 1000.0
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    # Handy for pointing the real app at it: GROQ_BASE_URL=http://127.0.0.1:8765 streamlit run chatbot.py
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stub Groq/Whisper server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StubServer(args.latency_ms, port=args.port)
+    print(f"Stub Groq/Whisper server on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
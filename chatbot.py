@@ -7,12 +7,15 @@ from datetime import datetime
 from dotenv import load_dotenv
 from openai import OpenAI
 import io
+import hashlib
 
 # Your custom modules
 from context import init_conversation as PATIENT_CONTEXT_FUNC
 from context_2 import init_conversation as DOCTOR_CONTEXT_FUNC
-from core.ocr_engine import extract_text_from_file
-from local_db import init_db, create_session, save_message
+from core.chat import respond
+from core.lab_extract import lab_digest
+from core.report import read_report
+from local_db import init_db, create_session, save_message, save_lab_results, get_other_upload_lab_values
 from streamlit_mic_recorder import mic_recorder
 
 # ────────────────────────────────────────────────────────────────
@@ -40,7 +43,7 @@ llm_client = Groq(api_key=GROQ_API_KEY)
 
 whisper_client = OpenAI(
     api_key=GROQ_API_KEY,
-    base_url="https://api.groq.com/openai/v1"
+    base_url=os.getenv("GROQ_BASE_URL", "https://api.groq.com").rstrip("/") + "/openai/v1"
 )
 
 LANGUAGES = {
@@ -51,10 +54,6 @@ LANGUAGES = {
     "Svenska": "sv"
 }
 
-# Fake hospital contact details (for demo/safety)
-FAKE_EMERGENCY_NUMBER = "+91-214-352-354-235"
-FAKE_APPOINTMENT_EMAIL = "dvvratshuk@softsensor.ai"
-
 # ────────────────────────────────────────────────────────────────
 # SESSION STATE
 # ────────────────────────────────────────────────────────────────
@@ -79,58 +78,29 @@ for k, v in defaults.items():
 # ────────────────────────────────────────────────────────────────
 
 def ask_bot(user_message: str):
-    # ── Special handling for appointment / emergency / contact requests ──
-    contact_keywords = [
-        "appointment", "book", "schedule", "make appointment",
-        "contact", "call", "phone", "number", "email", "emergency",
-        "urgent", "hospital contact", "doctor contact", "help line"
-    ]
-
-    if any(kw in user_message.lower() for kw in contact_keywords):
-        reply = (
-            "I understand you would like to book an appointment or contact the hospital — "
-            "that's a really important step.\n\n"
-            "I cannot make bookings or calls directly, but you can reach out here:\n\n"
-            f"• **Emergency / Urgent help**: Call {FAKE_EMERGENCY_NUMBER}\n"
-            f"• **Appointments & general inquiries**: Email {FAKE_APPOINTMENT_EMAIL}\n\n"
-            "The team will assist you quickly. Would you like help preparing what to tell them?"
-        )
-        st.session_state.ui_history.append(("Assistant", reply))
-        save_message(st.session_state.session_id, "assistant", reply)
+    try:
+        reply = respond(llm_client, st.session_state.session_id, st.session_state.llm_history, user_message)
+    except Exception as e:
+        st.error(f"AI service error: {str(e)}")
         return
 
-    # ── Normal dangerous medical questions guardrail ──
-    dangerous = ["dose", "dosage", "how much", "treatment plan", "cure", "prescribe"]
-    if any(w in user_message.lower() for w in dangerous):
-        reply = (
-            "I'm not allowed to give dosages, drug names "
-            "or specific treatment recommendations.\n\n"
-            "Please discuss this with your oncologist."
-        )
-        st.session_state.ui_history.append(("Assistant", reply))
-        save_message(st.session_state.session_id, "assistant", reply)
-        return
+    st.session_state.ui_history.append(("Assistant", reply))
 
-    # Normal flow
-    save_message(st.session_state.session_id, "user", user_message)
-    st.session_state.llm_history.append({"role": "user", "content": user_message})
+@st.cache_data(show_spinner="Reading report...")
+def read_uploaded_report(file_bytes: bytes, suffix: str):
+    # Cached on the file bytes: Streamlit reruns the script on every interaction,
+    # and OCR is by far the slowest step
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(file_bytes)
+        path = tmp.name
 
     try:
-        response = llm_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=st.session_state.llm_history,
-            temperature=0.45,
-            max_tokens=320,
-            top_p=0.9
-        )
-        answer = response.choices[0].message.content.strip()
-
-        save_message(st.session_state.session_id, "assistant", answer)
-        st.session_state.llm_history.append({"role": "assistant", "content": answer})
-        st.session_state.ui_history.append(("Assistant", answer))
-
-    except Exception as e:
-        st.error(f"AI service error: {str(e)}")
+        return read_report(path)
+    finally:
+        try:
+            os.unlink(path)
+        except:
+            pass
 
 # ────────────────────────────────────────────────────────────────
 # LOGIN SCREEN
@@ -206,22 +176,28 @@ with left:
     file = st.file_uploader("PDF or Image", type=["pdf", "png", "jpg", "jpeg"])
 
     if file:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.name)[1]) as tmp:
-            tmp.write(file.read())
-            path = tmp.name
-
-        try:
-            text = extract_text_from_file(path)
-            st.text_area("Extracted text", text, height=160)
-
-            if st.button("Explain this report"):
-                st.session_state.ui_history.append(("You", "[Report analysis request]"))
+        file_bytes = file.read()
+        text, labs, other_lines = read_uploaded_report(file_bytes, os.path.splitext(file.name)[1])
+
+        st.text_area("Extracted text", text, height=160)
+
+        if labs:
+            st.dataframe([r._asdict() for r in labs], hide_index=True)
+
+        if st.button("Explain this report"):
+            st.session_state.ui_history.append(("You", "[Report analysis request]"))
+
+            if labs:
+                # Send a compact digest (plus any unparsed lines) instead of the raw OCR text
+                report_id = hashlib.sha1(file_bytes).hexdigest()[:12]
+                other_upload = get_other_upload_lab_values(st.session_state.session_id, report_id)
+                save_lab_results(st.session_state.session_id, report_id, labs)
+                ask_bot(
+                    "Please explain these lab results in simple, patient-friendly language:\n\n"
+                    + lab_digest(labs, other_upload, other_lines)
+                )
+            else:
                 ask_bot(f"Please explain this report in simple, patient-friendly language:\n\n{text}")
-        finally:
-            try:
-                os.unlink(path)
-            except:
-                pass
 
 # ── RIGHT: Chat ──
 with right:
@@ -0,0 +1,40 @@
+# core/chat.py — one chat turn without Streamlit: guardrails → persistence → Groq
+# Shared by chatbot.ask_bot and the bench load driver so both exercise the same code.
+
+from typing import Dict, List
+
+from core.guardrails import guardrail_reply
+from local_db import save_message
+
+
+LLM_MODEL = "llama-3.3-70b-versatile"
+
+
+def respond(client, session_id: str, llm_history: List[Dict], user_message: str) -> str:
+    """
+    Answer one user message and persist it; `llm_history` is updated in place.
+    Guardrail replies skip the LLM. LLM errors propagate to the caller
+    (the user message is already saved and appended by then, as before).
+    """
+    # ── Appointment / contact requests and dangerous medical questions ──
+    reply = guardrail_reply(user_message)
+    if reply is not None:
+        save_message(session_id, "assistant", reply)
+        return reply
+
+    # Normal flow
+    save_message(session_id, "user", user_message)
+    llm_history.append({"role": "user", "content": user_message})
+
+    response = client.chat.completions.create(
+        model=LLM_MODEL,
+        messages=llm_history,
+        temperature=0.45,
+        max_tokens=320,
+        top_p=0.9
+    )
+    answer = response.choices[0].message.content.strip()
+
+    save_message(session_id, "assistant", answer)
+    llm_history.append({"role": "assistant", "content": answer})
+    return answer
@@ -0,0 +1,47 @@
+# core/guardrails.py — keyword guardrails applied before a message reaches the LLM
+# Kept free of Streamlit so it can be reused by the app and the offline benchmarks.
+
+from typing import Optional
+
+
+# Fake hospital contact details (for demo/safety)
+FAKE_EMERGENCY_NUMBER = "+91-214-352-354-235"
+FAKE_APPOINTMENT_EMAIL = "dvvratshuk@softsensor.ai"
+
+CONTACT_KEYWORDS = [
+    "appointment", "book", "schedule", "make appointment",
+    "contact", "call", "phone", "number", "email", "emergency",
+    "urgent", "hospital contact", "doctor contact", "help line"
+]
+
+DANGEROUS_KEYWORDS = ["dose", "dosage", "how much", "treatment plan", "cure", "prescribe"]
+
+CONTACT_REPLY = (
+    "I understand you would like to book an appointment or contact the hospital — "
+    "that's a really important step.\n\n"
+    "I cannot make bookings or calls directly, but you can reach out here:\n\n"
+    f"• **Emergency / Urgent help**: Call {FAKE_EMERGENCY_NUMBER}\n"
+    f"• **Appointments & general inquiries**: Email {FAKE_APPOINTMENT_EMAIL}\n\n"
+    "The team will assist you quickly. Would you like help preparing what to tell them?"
+)
+
+DANGEROUS_REPLY = (
+    "I'm not allowed to give dosages, drug names "
+    "or specific treatment recommendations.\n\n"
+    "Please discuss this with your oncologist."
+)
+
+
+def guardrail_reply(user_message: str) -> Optional[str]:
+    """Return a canned reply if the message trips a guardrail, else None."""
+    text = user_message.lower()
+
+    # ── Appointment / emergency / contact requests ──
+    if any(kw in text for kw in CONTACT_KEYWORDS):
+        return CONTACT_REPLY
+
+    # ── Dangerous medical questions ──
+    if any(w in text for w in DANGEROUS_KEYWORDS):
+        return DANGEROUS_REPLY
+
+    return None
@@ -0,0 +1,241 @@
+# core/lab_extract.py — structured lab values (blood tests, tumor markers) from OCR boxes
+#
+# EasyOCR boxes → table rows (by bounding-box geometry) → one bulk regex pass over all rows
+# → typed LabResult records → short digest for the LLM (results plus any unparsed lines).
+
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import re
+
+
+class LabResult(NamedTuple):
+    analyte: str
+    value: float
+    unit: str
+    ref_low: Optional[float]
+    ref_high: Optional[float]
+    flag: str  # "H", "L" or "" (within range / no range)
+
+
+# A comma followed by exactly 3 digits (1,234,567) or by 2-digit lakh groups (2,50,000)
+# is a thousands separator; any other comma is a decimal point (3,1 → 3.1).
+_THOUSANDS = r"(?:\d{1,3}(?:,\d{3})+|\d{1,2}(?:,\d{2})+,\d{3})(?:\.\d+)?"
+_NUM = rf"(?:{_THOUSANDS}(?![\d,])|\d+(?:\.\d+|,(?!\d{{3}}(?!\d))(?!\d{{2}},)\d+)?(?![\d,.]))"
+_THOUSANDS_RE = re.compile(_THOUSANDS)
+
+_UNIT = r"(?:x[ \t]*)?10\^\d+/?[A-Za-zµμ]*|[/A-Za-zµμ%][A-Za-z0-9µμ%/^.\-]*"
+
+# Header / demographic words that look like "name number range" but are not tests
+_STOP_WORDS_RE = re.compile(r"\b(?:age|date|page|patient|ref|sample)\b", re.IGNORECASE)
+# "Platelet Count 250,000 /cumm": a number followed by a unit or a range inside the analyte
+# means the split went wrong. Plain digits in names ("Beta 2 Microglobulin", "25 OH") are fine.
+_UNIT_TOKEN = (
+    r"(?:x[ \t]*)?10\^|[^\s]*[/%^][^\s]*"
+    r"|(?:mg|g|ng|pg|µg|ug|mmol|µmol|umol|iu|miu|u|fl|cells|mm|sec|years|yrs)\b"
+)
+_VALUE_IN_ANALYTE_RE = re.compile(
+    rf"\d[ \t]+(?:{_UNIT_TOKEN}|{_NUM}[ \t]*(?:-|–|to)[ \t]*\d)",
+    re.IGNORECASE,
+)
+
+# One row per line: analyte, optional H/L marker, value, optional marker, unit, reference range.
+# Only horizontal whitespace is allowed, so a match never spans two rows of the joined text.
+# Anchored at both ends so multi-word analytes with digits ("CA 19-9") backtrack correctly.
+_ROW_RE = re.compile(
+    rf"""^[ \t]*
+    (?P<analyte>[A-Za-z][A-Za-z0-9 ()/.,'+\-]*?)[ \t]*[:]?[ \t]+
+    (?:[HL*][ \t]+)?
+    [<>]?[ \t]*(?P<value>{_NUM})[ \t]*
+    (?:[HL*][ \t]+)?
+    (?P<unit>{_UNIT})?[ \t]*
+    (?:
+        (?P<low>{_NUM})[ \t]*(?:-|–|to)[ \t]*(?P<high>{_NUM})
+      | (?:<|<=|≤|up[ ]to)[ \t]*(?P<upper>{_NUM})
+      | (?:>|>=|≥)[ \t]*(?P<lower>{_NUM})
+    )
+    [ \t]*(?P<range_unit>{_UNIT})?
+    [ \t]*$""",
+    re.IGNORECASE | re.MULTILINE | re.VERBOSE,
+)
+
+
+# ────────────────────────────────────────────────────────────────
+# ROW RECONSTRUCTION
+# ────────────────────────────────────────────────────────────────
+
+def group_rows(boxes: list, row_tolerance: float = 0.5) -> List[str]:
+    """
+    Rebuild text lines from EasyOCR (bbox, text, confidence) boxes.
+    Boxes whose vertical centres are within `row_tolerance` × median box height
+    are one row; each row is read left to right.
+    """
+    if not boxes:
+        return []
+
+    items = []
+    heights = []
+    for bbox, text, *_ in boxes:
+        ys = [pt[1] for pt in bbox]
+        xs = [pt[0] for pt in bbox]
+        items.append(((min(ys) + max(ys)) / 2, min(xs), text))
+        heights.append(max(ys) - min(ys))
+
+    heights.sort()
+    gap = max(heights[len(heights) // 2], 1.0) * row_tolerance
+
+    items.sort()
+    rows, current, row_y = [], [], None
+    for y, x, text in items:
+        if current and y - row_y > gap:
+            rows.append(current)
+            current = []
+        if not current:
+            row_y = y
+        current.append((x, text))
+    rows.append(current)
+
+    return [" ".join(text for _, text in sorted(row)) for row in rows]
+
+
+def _page_text(boxes: list, error: Optional[str]) -> str:
+    return error or "\n".join(group_rows(boxes))
+
+
+def boxes_to_text(pages: List[tuple]) -> str:
+    """
+    Readable text from extract_boxes_from_file's (boxes, error) pages,
+    in the same page layout and with the same error messages as ocr_pdf_pymupdf.
+    """
+    if len(pages) == 1:
+        return _page_text(*pages[0])
+
+    return "\n\n".join(
+        f"--- PAGE {n + 1} ---\n" + _page_text(boxes, error)
+        for n, (boxes, error) in enumerate(pages)
+    )
+
+
+# ────────────────────────────────────────────────────────────────
+# PARSING
+# ────────────────────────────────────────────────────────────────
+
+def _to_float(s: Optional[str]) -> Optional[float]:
+    if not s:
+        return None
+    if _THOUSANDS_RE.fullmatch(s):
+        return float(s.replace(",", ""))
+    return float(s.replace(",", "."))
+
+
+def parse_lab_report(rows: List[str]) -> Tuple[List[LabResult], List[str]]:
+    """
+    Parse analyte / value / unit / reference range from all rows in a single regex pass.
+    Identical rows (e.g. repeated across pages) are kept once; an analyte reported again
+    with a different value is kept as a separate result.
+
+    Returns (results, other_lines): every non-empty row that did not become a result
+    (headers, qualitative results, comments, rows without a range) is kept, in order,
+    so nothing in the report is silently dropped.
+    """
+    results = []
+    seen = set()
+    parsed = set()
+
+    text = "\n".join(rows)
+    line_starts = [0]
+    for row in rows[:-1]:
+        line_starts.append(line_starts[-1] + len(row) + 1)
+
+    for m in _ROW_RE.finditer(text):
+        analyte = " ".join(m["analyte"].split()).rstrip(" :.-")
+        if _VALUE_IN_ANALYTE_RE.search(analyte) or _STOP_WORDS_RE.search(analyte):
+            continue
+        parsed.add(bisect_right(line_starts, m.start()) - 1)
+
+        value = _to_float(m["value"])
+        low = _to_float(m["low"] or m["lower"])
+        high = _to_float(m["high"] or m["upper"])
+        if m["upper"] is not None:
+            low = 0.0
+
+        if high is not None and value > high:
+            flag = "H"
+        elif low is not None and value < low:
+            flag = "L"
+        else:
+            flag = ""
+
+        result = LabResult(analyte, value, m["unit"] or m["range_unit"] or "", low, high, flag)
+        key = (analyte.lower(), value, result.unit, low, high)
+        if key in seen:
+            continue
+        seen.add(key)
+        results.append(result)
+
+    other_lines = []
+    for i, row in enumerate(rows):
+        row = row.strip()
+        if row and i not in parsed and row not in other_lines:
+            other_lines.append(row)
+
+    return results, other_lines
+
+
+def parse_lab_rows(rows: List[str]) -> List[LabResult]:
+    """Structured lab results only; see parse_lab_report."""
+    return parse_lab_report(rows)[0]
+
+
+def extract_lab_results(pages: List[tuple]) -> Tuple[List[LabResult], List[str]]:
+    """Per-page (boxes, error) OCR output → (structured lab results, unparsed lines)."""
+    rows = [row for boxes, _ in pages for row in group_rows(boxes)]
+    return parse_lab_report(rows)
+
+
+# ────────────────────────────────────────────────────────────────
+# DIGEST FOR THE LLM
+# ────────────────────────────────────────────────────────────────
+
+def _fmt(x: Optional[float]) -> str:
+    return "?" if x is None else f"{x:g}"
+
+
+def lab_digest(
+    results: List[LabResult],
+    other_upload: Optional[Dict[str, float]] = None,
+    other_lines: Optional[List[str]] = None,
+) -> str:
+    """
+    Short structured summary of lab results for the prompt.
+    `other_upload` maps analyte → value from the most recently uploaded other report
+    (upload order, not report date). `other_lines` is the report text the parser did
+    not turn into results; it is appended verbatim.
+    """
+    other_upload = other_upload or {}
+    flagged = sum(1 for r in results if r.flag)
+    counts = Counter(r.analyte for r in results)
+    lines = [f"Structured lab results ({len(results)} tests, {flagged} outside reference range):"]
+
+    for r in results:
+        line = f"- {r.analyte}: {_fmt(r.value)} {r.unit}".rstrip()
+        if r.ref_high is not None:
+            line += f" (ref {_fmt(r.ref_low or 0.0)}-{_fmt(r.ref_high)})"
+        elif r.ref_low is not None:
+            line += f" (ref > {_fmt(r.ref_low)})"
+        if r.flag:
+            line += " HIGH" if r.flag == "H" else " LOW"
+        if counts[r.analyte] > 1:
+            line += " [reported more than once in this upload with different values]"
+        other = other_upload.get(r.analyte)
+        if other is not None:
+            change = "higher" if r.value > other else "lower" if r.value < other else "same"
+            line += f" [another upload had {_fmt(other)}; this report is {change}]"
+        lines.append(line)
+
+    if other_lines:
+        lines.append("")
+        lines.append("Other report text:")
+        lines.extend(other_lines)
+
+    return "\n".join(lines)
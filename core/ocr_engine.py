@@ -6,6 +6,7 @@ import os
 import tempfile
 
 import easyocr
+from easyocr.utils import get_paragraph
 import fitz  # PyMuPDF
 
 
@@ -30,36 +31,41 @@ def ocr_image(path: Union[str, Path], langs=None, gpu=False) -> str:
         return f"⚠️ Image OCR failed: {e}"
 
 
-def ocr_pdf_pymupdf(path: Union[str, Path], langs=None, gpu=False, zoom=2.0) -> str:
+def ocr_image_boxes(path: Union[str, Path], langs=None, gpu=False) -> tuple:
     """
-    OCR PDF using PyMuPDF (fitz) → convert each page to image.
-    Uses Windows-safe manual temp file creation.
+    OCR image using EasyOCR, keeping geometry.
+    Returns (boxes, error): EasyOCR's raw (bbox, text, confidence) tuples and None,
+    or [] and a warning message if OCR failed.
     """
-    texts = []
-
     try:
-        doc = fitz.open(str(path))
+        reader = _get_reader(langs, gpu)
+        return reader.readtext(str(path), detail=1, paragraph=False), None
     except Exception as e:
-        return f"⚠️ Failed to open PDF: {e}"
+        return [], f"⚠️ Image OCR failed: {e}"
+
 
+def _ocr_pdf_pages(path: Union[str, Path], ocr_fn, zoom=2.0) -> list:
+    """
+    Render each PDF page to a temp PNG with PyMuPDF and run `ocr_fn` on it.
+    Returns [(page_number, result, error)]; raises if the PDF cannot be opened.
+    Uses Windows-safe manual temp file creation.
+    """
+    pages = []
+    doc = fitz.open(str(path))
     temp_dir = tempfile.gettempdir()
 
     for page_number in range(len(doc)):
+        temp_path = os.path.join(temp_dir, f"pdf_page_{os.getpid()}_{page_number}.png")
         try:
             page = doc.load_page(page_number)
             mat = fitz.Matrix(zoom, zoom)
             pix = page.get_pixmap(matrix=mat)
 
-            # Windows-safe temp file creation
-            temp_path = os.path.join(temp_dir, f"pdf_page_{os.getpid()}_{page_number}.png")
             pix.save(temp_path)
-
-            # OCR page
-            text = ocr_image(temp_path, langs, gpu)
-            texts.append(f"--- PAGE {page_number + 1} ---\n{text}")
+            pages.append((page_number, ocr_fn(temp_path), None))
 
         except Exception as e:
-            texts.append(f"⚠️ Failed OCR on page {page_number + 1}: {e}")
+            pages.append((page_number, None, e))
 
         finally:
             # Always try delete without raising exceptions
@@ -69,9 +75,41 @@ def ocr_pdf_pymupdf(path: Union[str, Path], langs=None, gpu=False, zoom=2.0) ->
             except:
                 pass
 
+    return pages
+
+
+def ocr_pdf_pymupdf(path: Union[str, Path], langs=None, gpu=False, zoom=2.0) -> str:
+    """
+    OCR PDF using PyMuPDF (fitz) → convert each page to image.
+    """
+    try:
+        pages = _ocr_pdf_pages(path, lambda p: ocr_image(p, langs, gpu), zoom)
+    except Exception as e:
+        return f"⚠️ Failed to open PDF: {e}"
+
+    texts = []
+    for page_number, text, error in pages:
+        if error is not None:
+            texts.append(f"⚠️ Failed OCR on page {page_number + 1}: {error}")
+        else:
+            texts.append(f"--- PAGE {page_number + 1} ---\n{text}")
+
     return "\n\n".join(texts)
 
 
+def ocr_pdf_boxes(path: Union[str, Path], langs=None, gpu=False, zoom=2.0) -> list:
+    """OCR PDF keeping geometry. Returns one (boxes, error) tuple per page."""
+    try:
+        pages = _ocr_pdf_pages(path, lambda p: ocr_image_boxes(p, langs, gpu), zoom)
+    except Exception as e:
+        return [([], f"⚠️ Failed to open PDF: {e}")]
+
+    return [
+        page if error is None else ([], f"⚠️ Failed OCR on page {page_number + 1}: {error}")
+        for page_number, page, error in pages
+    ]
+
+
 def extract_text_from_file(path: Union[str, Path], langs=None, gpu=False) -> str:
     """Autodetect file type."""
     suffix = Path(path).suffix.lower()
@@ -80,3 +118,38 @@ def extract_text_from_file(path: Union[str, Path], langs=None, gpu=False) -> str
         return ocr_pdf_pymupdf(path, langs, gpu)
 
     return ocr_image(path, langs, gpu)
+
+
+def extract_boxes_from_file(path: Union[str, Path], langs=None, gpu=False) -> list:
+    """Autodetect file type; returns one (boxes, error) tuple per page."""
+    suffix = Path(path).suffix.lower()
+
+    if suffix == ".pdf":
+        return ocr_pdf_boxes(path, langs, gpu)
+
+    return [ocr_image_boxes(path, langs, gpu)]
+
+
+def text_from_boxes(path: Union[str, Path], pages: list) -> str:
+    """
+    Same text extract_text_from_file would return, rebuilt from extract_boxes_from_file's
+    (boxes, error) pages without a second OCR pass. readtext(paragraph=True) is
+    get_paragraph() over the detail boxes with these defaults.
+    """
+    def page_text(boxes, error):
+        if error:
+            return error
+        return "\n".join(text for _, text in get_paragraph(boxes, x_ths=1.0, y_ths=0.5, mode="ltr"))
+
+    if Path(path).suffix.lower() != ".pdf":
+        return page_text(*pages[0])
+
+    texts = []
+    for page_number, (boxes, error) in enumerate(pages):
+        # open / render failures stood alone in ocr_pdf_pymupdf; OCR output had a page header
+        if error and error.startswith("⚠️ Failed"):
+            texts.append(error)
+        else:
+            texts.append(f"--- PAGE {page_number + 1} ---\n{page_text(boxes, error)}")
+
+    return "\n\n".join(texts)
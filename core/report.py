@@ -0,0 +1,27 @@
+# core/report.py — uploaded report → (preview text, lab results, unparsed lines) in one OCR pass
+# Shared by chatbot.py and the bench so both exercise the same upload path.
+
+from pathlib import Path
+from typing import List, Tuple, Union
+
+from core.lab_extract import LabResult, boxes_to_text, extract_lab_results
+from core.ocr_engine import extract_boxes_from_file, text_from_boxes
+
+
+# Below this many parsed rows the upload is treated as a narrative report (e.g. histopathology)
+MIN_LAB_ROWS = 3
+
+
+def read_report(path: Union[str, Path], langs=None, gpu=False) -> Tuple[str, List[LabResult], List[str]]:
+    """
+    OCR once with geometry, then either:
+    - lab report: table rows as text, structured results, and the lines the parser skipped
+    - narrative report: EasyOCR paragraph text (multi-column safe), no results
+    """
+    pages = extract_boxes_from_file(path, langs, gpu)
+    labs, other_lines = extract_lab_results(pages)
+
+    if len(labs) >= MIN_LAB_ROWS:
+        return boxes_to_text(pages), labs, other_lines
+
+    return text_from_boxes(path, pages), [], []
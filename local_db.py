@@ -32,6 +32,23 @@ def init_db():
     )
     """)
 
+    # One row per parsed result per uploaded report; typed columns so trends are plain SQL
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS lab_results (
+        session_id TEXT,
+        report_id TEXT,
+        row_no INTEGER,
+        analyte TEXT,
+        value REAL,
+        unit TEXT,
+        ref_low REAL,
+        ref_high REAL,
+        flag TEXT,
+        created_at TEXT,
+        PRIMARY KEY (session_id, report_id, row_no)
+    )
+    """)
+
     conn.commit()
     conn.close()
 
@@ -88,3 +105,43 @@ def save_message(session_id, role, content):
     conn.close()
 
     update_session_activity(session_id)
+
+
+def save_lab_results(session_id, report_id, results):
+    """Bulk-insert LabResult rows; re-saving the same report is a no-op."""
+    ensure_session_exists(session_id)
+
+    conn = get_conn()
+    cur = conn.cursor()
+
+    now = datetime.utcnow().isoformat()
+    cur.executemany("""
+    INSERT OR IGNORE INTO lab_results
+    (session_id, report_id, row_no, analyte, value, unit, ref_low, ref_high, flag, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (session_id, report_id, row_no, r.analyte, r.value, r.unit, r.ref_low, r.ref_high, r.flag, now)
+        for row_no, r in enumerate(results)
+    ])
+
+    conn.commit()
+    conn.close()
+
+
+def get_other_upload_lab_values(session_id, report_id):
+    """
+    Latest-uploaded value per analyte across this session's other reports.
+    Ordered by upload time, not report date: an older report uploaded later wins.
+    """
+    conn = get_conn()
+    cur = conn.cursor()
+
+    cur.execute("""
+    SELECT analyte, value FROM lab_results
+    WHERE session_id = ? AND report_id != ?
+    ORDER BY created_at, row_no
+    """, (session_id, report_id))
+
+    values = dict(cur.fetchall())  # later uploads overwrite earlier ones
+    conn.close()
+    return values
@@ -0,0 +1,49 @@
+import pytest
+
+from bench.run_bench import compare, percentile
+
+
+@pytest.mark.parametrize("samples, pct, expected", [
+    ([], 50, 0.0),
+    ([3.0], 99, 3.0),
+    ([5, 1, 4, 2, 3], 50, 3),
+    (list(range(1, 101)), 95, 95),
+    (list(range(1, 11)), 99, 10),
+])
+def test_percentile(samples, pct, expected):
+    assert percentile(samples, pct) == expected
+
+
+BASE = {"chat": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 30.0, "throughput_ops": 100.0, "peak_rss_mb": 50.0}}
+
+
+@pytest.mark.parametrize("current, min_delta_ms, expected", [
+    # within tolerance
+    ({"p95_ms": 24.0, "throughput_ops": 80.0}, 0.0, []),
+    # latency regression
+    ({"p95_ms": 30.0}, 0.0, ["chat.p95_ms: 20.0 → 30.0 (+50%)"]),
+    # throughput regression (higher is better)
+    ({"throughput_ops": 50.0}, 0.0, ["chat.throughput_ops: 100.0 → 50.0 (-50%)"]),
+    # improvements never count
+    ({"p95_ms": 5.0, "throughput_ops": 500.0}, 0.0, []),
+    # memory regression
+    ({"peak_rss_mb": 80.0}, 0.0, ["chat.peak_rss_mb: 50.0 → 80.0 (+60%)"]),
+    # noise floor: +50% but only 10 ms absolute
+    ({"p95_ms": 30.0}, 15.0, []),
+    # noise floor on throughput: 10 ms → 20 ms per op is 10 ms of per-op time
+    ({"throughput_ops": 50.0}, 15.0, []),
+    ({"throughput_ops": 50.0}, 5.0, ["chat.throughput_ops: 100.0 → 50.0 (-50%)"]),
+    # missing metric in the current run is skipped
+    ({"p95_ms": None}, 0.0, []),
+])
+def test_compare(current, min_delta_ms, expected):
+    assert compare({"chat": current}, BASE, tolerance=0.25, min_delta_ms=min_delta_ms) == expected
+
+
+@pytest.mark.parametrize("baselines", [
+    {},                                # subsystem not in the baseline file
+    {"chat": {}},                      # empty entry
+    {"chat": {"p95_ms": 0.0}},         # zero baseline can't give a ratio
+])
+def test_compare_skips_unusable_baselines(baselines):
+    assert compare({"chat": {"p95_ms": 999.0}}, baselines, tolerance=0.25) == []
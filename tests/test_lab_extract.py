@@ -0,0 +1,152 @@
+import pytest
+
+from core.lab_extract import (
+    LabResult, boxes_to_text, extract_lab_results, lab_digest, parse_lab_report, parse_lab_rows,
+)
+
+
+@pytest.mark.parametrize("row, expected", [
+    ("Haemoglobin 11.2 g/dL 13.0 - 17.0",
+     LabResult("Haemoglobin", 11.2, "g/dL", 13.0, 17.0, "L")),
+    ("CA 19-9 52.3 U/mL 0.0 - 37.0",
+     LabResult("CA 19-9", 52.3, "U/mL", 0.0, 37.0, "H")),
+    # thousands separators, western and lakh style
+    ("Total Leucocyte Count 7,800 cells/cumm 4000 - 11000",
+     LabResult("Total Leucocyte Count", 7800.0, "cells/cumm", 4000.0, 11000.0, "")),
+    ("Platelet Count 250,000 /cumm 150,000 - 410,000",
+     LabResult("Platelet Count", 250000.0, "/cumm", 150000.0, 410000.0, "")),
+    ("Platelet Count 2,50,000 /cumm 1,50,000 - 4,10,000",
+     LabResult("Platelet Count", 250000.0, "/cumm", 150000.0, 410000.0, "")),
+    # decimal comma
+    ("CEA : 3,1 ng/mL < 5",
+     LabResult("CEA", 3.1, "ng/mL", 0.0, 5.0, "")),
+    # < / > ranges
+    ("CA-125 40.9 U/mL < 35",
+     LabResult("CA-125", 40.9, "U/mL", 0.0, 35.0, "H")),
+    ("Albumin 3.0 g/dL > 3.5",
+     LabResult("Albumin", 3.0, "g/dL", 3.5, None, "L")),
+    # H/L markers next to the value
+    ("PSA (Total) H 6.2 ng/mL 0 to 4",
+     LabResult("PSA (Total)", 6.2, "ng/mL", 0.0, 4.0, "H")),
+    ("Haemoglobin 9.1 L g/dL 13.0 - 17.0",
+     LabResult("Haemoglobin", 9.1, "g/dL", 13.0, 17.0, "L")),
+    # units starting with 10^
+    ("Platelets 500 10^3/uL 150-410",
+     LabResult("Platelets", 500.0, "10^3/uL", 150.0, 410.0, "H")),
+    ("WBC 7.2 x 10^9/L 4.0 - 11.0",
+     LabResult("WBC", 7.2, "x 10^9/L", 4.0, 11.0, "")),
+    ("Platelets 300 10^3/µL 150 - 410",
+     LabResult("Platelets", 300.0, "10^3/µL", 150.0, 410.0, "")),
+    # digits inside real analyte names
+    ("Beta 2 Microglobulin 3.1 mg/L 0.8 - 2.2",
+     LabResult("Beta 2 Microglobulin", 3.1, "mg/L", 0.8, 2.2, "H")),
+    ("Vitamin D (25 OH) 18 ng/mL 30 - 100",
+     LabResult("Vitamin D (25 OH)", 18.0, "ng/mL", 30.0, 100.0, "L")),
+    # unit after the range
+    ("Creatinine 0.9 0.7 - 1.3 mg/dL",
+     LabResult("Creatinine", 0.9, "mg/dL", 0.7, 1.3, "")),
+])
+def test_parse_lab_row(row, expected):
+    assert parse_lab_rows([row]) == [expected]
+
+
+@pytest.mark.parametrize("row", [
+    "City Oncology Lab - Laboratory Report",
+    "Test Result Unit Reference Range",
+    "Patient: Test Patient 0 Page 1 of 2",
+    "Patient age 45 Years 18 - 99",
+    "Age 45 Years 18 - 99",
+    "Date 12 2024 1 - 2",
+    "Sample No 4411 1 - 2",
+    "Ref. Range 13 - 17",
+])
+def test_non_lab_lines_do_not_match(row):
+    assert parse_lab_rows([row]) == []
+
+
+@pytest.mark.parametrize("rows, expected, other_lines", [
+    (["CEA 3.1 < 5", "BIOCHEMISTRY"],
+     [LabResult("CEA", 3.1, "", 0.0, 5.0, "")],
+     ["BIOCHEMISTRY"]),
+    (["CEA 3.1 ng/mL < 5", "AFP", "6.0 ng/mL < 8.5"],
+     [LabResult("CEA", 3.1, "ng/mL", 0.0, 5.0, "")],
+     ["AFP", "6.0 ng/mL < 8.5"]),
+    (["Result 12", "13 - 17"], [], ["Result 12", "13 - 17"]),
+    (["Remarks", "5 10 - 20"], [], ["Remarks", "5 10 - 20"]),
+])
+def test_matches_never_span_rows(rows, expected, other_lines):
+    assert parse_lab_report(rows) == (expected, other_lines)
+
+
+def test_unparsed_lines_reach_the_digest():
+    results, other_lines = parse_lab_report([
+        "HAEMATOLOGY",
+        "Haemoglobin 11 g/dL 13 - 17",
+        "HBsAg Non-reactive",
+        "ESR 12 mm/hr",
+        "Impression: mild anaemia",
+        "HAEMATOLOGY",
+    ])
+
+    assert other_lines == ["HAEMATOLOGY", "HBsAg Non-reactive", "ESR 12 mm/hr", "Impression: mild anaemia"]
+    assert lab_digest(results, other_lines=other_lines) == (
+        "Structured lab results (1 tests, 1 outside reference range):\n"
+        "- Haemoglobin: 11 g/dL (ref 13-17) LOW\n"
+        "\n"
+        "Other report text:\n"
+        "HAEMATOLOGY\n"
+        "HBsAg Non-reactive\n"
+        "ESR 12 mm/hr\n"
+        "Impression: mild anaemia"
+    )
+
+
+def test_repeated_rows_deduplicated_but_changed_values_kept():
+    rows = [
+        "CEA 3.1 ng/mL < 5",
+        "CEA 3.1 ng/mL < 5",  # same row repeated on page 2
+        "CEA 7.9 ng/mL < 5",  # cumulative report, new value
+    ]
+    results = parse_lab_rows(rows)
+
+    assert [r.value for r in results] == [3.1, 7.9]
+    assert "reported more than once" in lab_digest(results)
+
+
+def test_lab_digest_other_upload():
+    results = parse_lab_rows(["CEA 7.9 ng/mL < 5"])
+
+    assert lab_digest(results, {"CEA": 3.1}) == (
+        "Structured lab results (1 tests, 1 outside reference range):\n"
+        "- CEA: 7.9 ng/mL (ref 0-5) HIGH [another upload had 3.1; this report is higher]"
+    )
+
+
+def _box(x, y, text):
+    return ([[x, y], [x + 60, y], [x + 60, y + 20], [x, y + 20]], text, 0.9)
+
+
+def test_rows_rebuilt_from_boxes():
+    page = [
+        _box(400, 11, "13.0 - 17.0"),
+        _box(200, 9, "11.2"),
+        _box(10, 50, "CEA"),
+        _box(10, 10, "Haemoglobin"),
+        _box(300, 12, "g/dL"),
+        _box(200, 52, "9.9"),
+        _box(400, 50, "0 - 5"),
+    ]
+
+    assert extract_lab_results([(page, None)]) == ([
+        LabResult("Haemoglobin", 11.2, "g/dL", 13.0, 17.0, "L"),
+        LabResult("CEA", 9.9, "", 0.0, 5.0, "H"),
+    ], [])
+
+
+def test_boxes_to_text_keeps_page_errors():
+    pages = [([_box(10, 10, "CEA 9.9 0 - 5")], None), ([], "⚠️ Failed OCR on page 2: boom")]
+
+    assert boxes_to_text(pages) == (
+        "--- PAGE 1 ---\nCEA 9.9 0 - 5\n\n"
+        "--- PAGE 2 ---\n⚠️ Failed OCR on page 2: boom"
+    )